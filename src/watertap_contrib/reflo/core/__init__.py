@@ -17,4 +17,5 @@ from .solar_energy_base import (
     SolarEnergyBaseData,
     SolarModelType,
     SolarSurrogateType,
+    clear_surrogate_cache,
 )
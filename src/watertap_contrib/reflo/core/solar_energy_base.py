@@ -48,6 +48,9 @@ from watertap.core.solvers import get_solver
 
 __author__ = "Kurban Sitterley"
 
+# Loaded surrogates keyed on path, with the file modification time and size
+_surrogate_cache = {}
+
 
 class SolarModelType(StrEnum):
     surrogate = "surrogate"
@@ -442,7 +445,7 @@ class SolarEnergyBaseData(UnitModelBlockData):
         sys.stdout = stream
 
         self.surrogate_blk = SurrogateBlock(concrete=True)
-        self.surrogate = PysmoSurrogate.load_from_file(self.config.surrogate_model_file)
+        self.surrogate = _load_surrogate_file(self.config.surrogate_model_file)
         self.surrogate_blk.build_model(
             self.surrogate,
             input_vars=self.surrogate_inputs,
@@ -617,3 +620,26 @@ class SolarEnergyBaseData(UnitModelBlockData):
             if len(self.data[label].unique()) == 1:
                 err_msg = f"Input variable '{label}' must have at least two unique values in the dataset to create surrogate."
                 raise ConfigurationError(err_msg)
+
+
+def _load_surrogate_file(surrogate_model_file):
+    """
+    Load a PysmoSurrogate from file, reusing a previously loaded
+    surrogate if the file has not been modified since.
+    """
+    path = os.path.abspath(surrogate_model_file)
+    stat = os.stat(path)
+    file_state = (stat.st_mtime_ns, stat.st_size)
+    cached = _surrogate_cache.get(path)
+    if cached is None or cached[0] != file_state:
+        cached = (file_state, PysmoSurrogate.load_from_file(path))
+        _surrogate_cache[path] = cached
+    return cached[1]
+
+
+def clear_surrogate_cache():
+    """
+    Remove all loaded surrogates from the cache, so the next solar
+    surrogate model that is built loads its surrogate from file.
+    """
+    _surrogate_cache.clear()
@@ -279,15 +279,16 @@ def set_inlet_conditions(m, Qin=4):
     rho = 1000 * pyunits.kg / pyunits.m**3
     print('\n=======> SETTING FEED CONDITIONS <======="\n')
 
+    # [kg/m3]
     inlet_dict = {
-        "Ca_2+": 0.61 * pyunits.kg / pyunits.m**3,
-        "Mg_2+": 0.161 * pyunits.kg / pyunits.m**3,
-        "Alkalinity_2-": 0.0821 * pyunits.kg / pyunits.m**3,
-        "SiO2": 0.13 * pyunits.kg / pyunits.m**3,
-        "Cl_-": 5.5 * pyunits.kg / pyunits.m**3,
-        "Na_+": 5.5 * pyunits.kg / pyunits.m**3,
-        "K_+": 0.016 * pyunits.kg / pyunits.m**3,
-        "SO4_2-": 0.23 * pyunits.kg / pyunits.m**3,
+        "Ca_2+": 0.61,
+        "Mg_2+": 0.161,
+        "Alkalinity_2-": 0.0821,
+        "SiO2": 0.13,
+        "Cl_-": 5.5,
+        "Na_+": 5.5,
+        "K_+": 0.016,
+        "SO4_2-": 0.23,
     }
 
     # initialize feed
@@ -295,22 +296,26 @@ def set_inlet_conditions(m, Qin=4):
     m.fs.treatment.feed.temperature[0].fix(293)
     m.fs.treatment.feed.properties[0].flow_mass_phase_comp["Liq", "H2O"].fix(Qin * rho)
 
+    # water flow is fixed once, solute flows are then computed as floats [kg/s]
+    flow_mass_water = value(
+        m.fs.treatment.feed.properties[0].flow_mass_phase_comp["Liq", "H2O"]
+    )
+    flow_vol = flow_mass_water / value(rho)
+
     for solute, solute_conc in inlet_dict.items():
+        flow_mass_solute = flow_vol * solute_conc
         m.fs.treatment.feed.properties[0].flow_mass_phase_comp["Liq", solute].fix(
-            Qin * solute_conc
+            flow_mass_solute
         )
         m.fs.MCAS_properties.set_default_scaling(
             "flow_mass_phase_comp",
-            1
-            / value(
-                m.fs.treatment.feed.properties[0].flow_mass_phase_comp["Liq", solute]
-            ),
+            1 / flow_mass_solute,
             index=("Liq", solute),
         )
 
     m.fs.MCAS_properties.set_default_scaling(
         "flow_mass_phase_comp",
-        1 / value(m.fs.treatment.feed.properties[0].flow_mass_phase_comp["Liq", "H2O"]),
+        1 / flow_mass_water,
         index=("Liq", "H2O"),
     )
 
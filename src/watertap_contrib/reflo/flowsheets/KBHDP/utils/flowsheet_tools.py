@@ -23,7 +23,14 @@ __all__ = [
 ]
 
 
-def solve(m, solver=None, tee=False, raise_on_failure=True, debug=False):
+def solve(
+    m,
+    solver=None,
+    tee=False,
+    raise_on_failure=True,
+    debug=False,
+    symbolic_solver_labels=False,
+):
 
     if solver is None:
         solver = get_solver()
@@ -31,7 +38,8 @@ def solve(m, solver=None, tee=False, raise_on_failure=True, debug=False):
 
     print("\n--------- SOLVING ---------\n")
 
-    results = solver.solve(m, tee=tee)
+    # symbolic labels map solver output back to component names for debugging
+    results = solver.solve(m, tee=tee, symbolic_solver_labels=symbolic_solver_labels)
 
     if check_optimal_termination(results):
         print("\n--------- OPTIMAL SOLVE!!! ---------\n")
@@ -192,17 +200,19 @@ def breakdown_dof(blk, detailed=False):
 
 def report_MCAS_stream_conc(m, stream):
     solute_set = m.fs.MCAS_properties.solute_set
+    conc = {i: stream.conc_mass_phase_comp["Liq", i] for i in solute_set}
+    # all solute concentrations share the same units
+    conc_units = pyunits.get_units(next(iter(conc.values())))
+    flow_water = stream.flow_mass_phase_comp["Liq", "H2O"]
     print(f"\n\n-------------------- {stream} CONCENTRATIONS --------------------\n\n")
     print(f'{"Component":<15s}{"Conc.":<10s}{"Units":10s}')
-    for i in solute_set:
-        print(
-            f"{i:<15s}: {stream.conc_mass_phase_comp['Liq', i].value:<10.3f}{pyunits.get_units(stream.conc_mass_phase_comp['Liq', i])}"
-        )
+    for i, c in conc.items():
+        print(f"{i:<15s}: {c.value:<10.3f}{conc_units}")
     print(
-        f'{"Overall TDS":<15s}: {sum(value(stream.conc_mass_phase_comp["Liq", i]) for i in solute_set):<10.3f}{pyunits.get_units(stream.conc_mass_phase_comp["Liq", "Ca_2+"])}'
+        f'{"Overall TDS":<15s}: {sum(value(c) for c in conc.values()):<10.3f}{conc_units}'
     )
     print(
-        f"{'Vol. Flow Rate':<15s}: {stream.flow_mass_phase_comp['Liq', 'H2O'].value:<10.3f}{pyunits.get_units(stream.flow_mass_phase_comp['Liq', 'H2O'])}"
+        f"{'Vol. Flow Rate':<15s}: {flow_water.value:<10.3f}{pyunits.get_units(flow_water)}"
     )
 
 
@@ -138,28 +138,22 @@ class PVBatterySurrogateData(SolarEnergyBaseData):
     def calculate_scaling_factors(self):
 
         if iscale.get_scaling_factor(self.system_capacity) is None:
-            sf = iscale.get_scaling_factor(self.system_capacity, default=1)
-            iscale.set_scaling_factor(self.system_capacity, sf)
+            iscale.set_scaling_factor(self.system_capacity, 1)
 
         if iscale.get_scaling_factor(self.battery_power) is None:
-            sf = iscale.get_scaling_factor(self.battery_power, default=1)
-            iscale.set_scaling_factor(self.battery_power, sf)
+            iscale.set_scaling_factor(self.battery_power, 1)
 
         if iscale.get_scaling_factor(self.hours_storage) is None:
-            sf = iscale.get_scaling_factor(self.hours_storage, default=1)
-            iscale.set_scaling_factor(self.hours_storage, sf)
+            iscale.set_scaling_factor(self.hours_storage, 1)
 
         if iscale.get_scaling_factor(self.land_req) is None:
-            sf = iscale.get_scaling_factor(self.land_req, default=1)
-            iscale.set_scaling_factor(self.land_req, sf)
+            iscale.set_scaling_factor(self.land_req, 1)
 
         if iscale.get_scaling_factor(self.electricity_annual) is None:
-            sf = iscale.get_scaling_factor(self.electricity_annual, default=1)
-            iscale.set_scaling_factor(self.electricity_annual, sf)
+            iscale.set_scaling_factor(self.electricity_annual, 1)
 
         if iscale.get_scaling_factor(self.electricity) is None:
-            sf = iscale.get_scaling_factor(self.electricity, default=1)
-            iscale.set_scaling_factor(self.electricity, sf)
+            iscale.set_scaling_factor(self.electricity, 1)
 
     def initialize(
         self,
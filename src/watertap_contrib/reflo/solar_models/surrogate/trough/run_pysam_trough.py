@@ -1,11 +1,11 @@
 import os
 import json
 import time
+import inspect
 import multiprocessing
 
 import numpy as np
 import pandas as pd
-from math import isnan
 from itertools import product
 import PySAM.TroughPhysicalIph as iph
 
@@ -16,6 +16,8 @@ __all__ = [
     "setup_model_trough",
     "run_model_trough",
     "setup_and_run_trough",
+    "TroughPool",
+    "create_trough_pool",
     "generate_trough_data",
 ]
 
@@ -31,13 +33,48 @@ config_file_default = os.path.join(__location__, "data/trough_physical_iph-reflo
 # You could also use default configurations available here:
 # https://nrel-pysam.readthedocs.io/en/latest/sam-configurations.html
 
+# PySAM model cached in each multiprocessing worker by _init_trough_worker
+_tech_model = None
+# Hours of storage from the worker's configuration, used for points without hours_storage
+_tshours_default = None
+# Settable input names for each PySAM model type, filled by _get_valid_keys
+_valid_keys = {}
+
+
+def _get_valid_keys(tech_model):
+    """
+    Return the names of all inputs that can be assigned on the PySAM model.
+    Inputs are the attributes of each parameter group (excluding Outputs);
+    the result is cached by model type.
+    """
+    model_type = type(tech_model)
+    if model_type not in _valid_keys:
+        keys = set()
+        for group_name in dir(tech_model):
+            if group_name.startswith("_") or group_name == "Outputs":
+                continue
+            group = getattr(tech_model, group_name)
+            if callable(group):
+                continue
+            keys.update(
+                k for k, v in vars(type(group)).items() if inspect.isgetsetdescriptor(v)
+            )
+        _valid_keys[model_type] = frozenset(keys)
+    return _valid_keys[model_type]
+
 
 def setup_model_trough(
     weather_file=None,
     config_file=None,
+    config_data=None,
 ):
     """
     Create the PySAM technology model for Trough industrial process heat (IPH) system.
+
+    :param weather_file: Path to the weather data file
+    :param config_file: Path to the configuration data file
+    :param config_data: Configuration data already loaded from the configuration file;
+                        if provided, config_file is not read
     """
 
     if weather_file is None:
@@ -46,7 +83,7 @@ def setup_model_trough(
             "Use the 'weather_file' argument to specify the path to the weather data file."
         )
 
-    if config_file is None:
+    if config_file is None and config_data is None:
         raise RuntimeError(
             "Configuration file must be specified for trough PySAM model setup. "
             "Use the 'config_file' argument to specify the path to the configuration data file."
@@ -54,15 +91,19 @@ def setup_model_trough(
 
     tech_model = iph.new()
 
-    with open(config_file, "r") as file:
-        config_data = json.load(file)
+    if config_data is None:
+        with open(config_file, "r") as file:
+            config_data = json.load(file)
+
+    valid_keys = _get_valid_keys(tech_model)
 
     for k, v in config_data.items():
-        if k != "number_inputs":
-            try:
-                tech_model.value(k, v)
-            except AttributeError:
-                print(f"Warning: {k} not found in the technology model. Skipping.")
+        if k == "number_inputs":
+            continue
+        if k in valid_keys:
+            tech_model.value(k, v)
+        else:
+            print(f"Warning: {k} not found in the technology model. Skipping.")
 
     tech_model.Weather.file_name = weather_file
 
@@ -85,6 +126,30 @@ def run_model_trough(
     :param temperature_loop: Loop outlet temperature in Celsius (default is 300 C)
     :param return_tech_model: If True, returns the tech_model object along with results
     """
+    raw_outputs = _execute_trough(
+        tech_model,
+        system_capacity=system_capacity,
+        hours_storage=hours_storage,
+        temperature_loop=temperature_loop,
+    )
+    results = {k: float(v) for k, v in _postprocess_trough_outputs(raw_outputs).items()}
+
+    if return_tech_model:
+        return results, tech_model
+    else:
+        return results
+
+
+def _execute_trough(
+    tech_model,
+    system_capacity=None,
+    hours_storage=None,
+    temperature_loop=300,
+):
+    """
+    Set the design inputs, execute the trough model, and return the raw
+    PySAM outputs as a tuple.
+    """
     if system_capacity is None:
         raise ValueError("system_capacity must be specified for trough model run.")
 
@@ -102,30 +167,47 @@ def run_model_trough(
     )
     tech_model.execute()
 
+    return (
+        tech_model.Outputs.annual_energy,  # [kWht]
+        tech_model.Outputs.annual_field_freeze_protection,  # [kWht]
+        tech_model.Outputs.annual_tes_freeze_protection,  # [kWht]
+        tech_model.value("q_pb_design"),  # [MWt]
+        tech_model.Outputs.annual_electricity_consumption,  # [kWhe]
+        tech_model.Outputs.solar_mult,
+        tech_model.Outputs.total_aperture,  # [m2]
+        tech_model.Outputs.nLoops,
+    )
+
+
+def _postprocess_trough_outputs(raw_outputs):
+    """
+    Calculate trough results from raw PySAM outputs.
+    Accepts the tuple from a single run or the stacked tuples from many runs,
+    in which case each result is an array with one entry per run.
+    """
+    (
+        annual_energy,
+        freeze_protection_field,
+        freeze_protection_tes,
+        q_pb_design,
+        electricity_annual,
+        solar_multiplier,
+        total_aperture_area,
+        number_loops,
+    ) = np.asarray(raw_outputs, dtype=np.float64).T
+
     # NOTE: freeze_protection_field can sometimes be nan (when it should be 0) and this causes other nan's
     #  Thus, freeze_protection, annual_energy and capacity_factor must be calculated manually
     # annual_energy = tech_model.Outputs.annual_energy                            # [kWht] net, does not include that used for freeze protection
     # freeze_protection = tech_model.Outputs.annual_thermal_consumption           # [kWht]
     # capacity_factor = tech_model.Outputs.capacity_factor                        # [%]
-
-    freeze_protection_field = tech_model.Outputs.annual_field_freeze_protection
-    freeze_protection_field = (
-        0 if isnan(freeze_protection_field) else freeze_protection_field
-    )  # occasionally seen to be nan
-    freeze_protection_tes = tech_model.Outputs.annual_tes_freeze_protection
-    freeze_protection_tes = 0 if isnan(freeze_protection_tes) else freeze_protection_tes
-    freeze_protection = freeze_protection_field + freeze_protection_tes
+    freeze_protection = np.where(
+        np.isnan(freeze_protection_field), 0, freeze_protection_field
+    ) + np.where(np.isnan(freeze_protection_tes), 0, freeze_protection_tes)
 
     # [kWht] net, does not include that used for freeze protection
-    heat_annual = tech_model.Outputs.annual_energy - freeze_protection
-    capacity_factor = (
-        heat_annual / (tech_model.value("q_pb_design") * 1e3 * 8760) * 100
-    )  # [%]
-
-    electricity_annual = tech_model.Outputs.annual_electricity_consumption  # [kWhe]
-    solar_multiplier = tech_model.Outputs.solar_mult
-    total_aperture_reflective_area = tech_model.Outputs.total_aperture  # [m2]
-    nloops = tech_model.Outputs.nLoops
+    heat_annual = annual_energy - freeze_protection
+    capacity_factor = heat_annual / (q_pb_design * 1e3 * 8760) * 100  # [%]
 
     results = {
         "heat_annual": heat_annual,  # [kWh] annual net thermal energy production in year 1
@@ -133,14 +215,11 @@ def run_model_trough(
         "freeze_protection": freeze_protection,  # [kWht]
         "capacity_factor": capacity_factor,  # [%] capacity factor
         "solar_multiplier": solar_multiplier,
-        "total_aperture_area": total_aperture_reflective_area,
-        "number_loops": nloops,
+        "total_aperture_area": total_aperture_area,  # [m2]
+        "number_loops": number_loops,
     }
 
-    if return_tech_model:
-        return results, tech_model
-    else:
-        return results
+    return results
 
 
 def setup_and_run_trough(
@@ -167,6 +246,123 @@ def setup_and_run_trough(
     return results
 
 
+def _init_trough_worker(weather_file, config_data):
+    """
+    Pool initializer that sets up the PySAM model once per worker process
+    so it can be reused for every point the worker runs.
+    The configuration data is parsed once by the parent process and
+    sent to each worker only here, not with every task.
+    """
+    global _tech_model, _tshours_default
+    _tech_model = setup_model_trough(weather_file=weather_file, config_data=config_data)
+    _tshours_default = _tech_model.value("tshours")
+
+
+def _run_trough_point(system_capacity, hours_storage, temperature_loop):
+    """
+    Run the worker's cached PySAM model for a single point
+    and return the raw outputs.
+    If hours_storage is None, the configured hours of storage are used
+    rather than whatever the worker's previous point set.
+    """
+    if hours_storage is None:
+        hours_storage = _tshours_default
+    return _execute_trough(
+        _tech_model,
+        system_capacity=system_capacity,
+        hours_storage=hours_storage,
+        temperature_loop=temperature_loop,
+    )
+
+
+def _run_trough_point_indexed(point):
+    """
+    Run a single (index, combo) point and return the index with the raw outputs
+    so results collected out of order can be put back in place.
+    """
+    idx, combo = point
+    return idx, _run_trough_point(*combo)
+
+
+def _run_trough_points(pool, combos, chunksize=1):
+    """
+    Run all combos on the pool and return the raw outputs in the order of combos.
+    """
+    raw_outputs = [None] * len(combos)
+    # collect results as they finish rather than waiting on the slowest
+    for idx, raw in pool.imap_unordered(
+        _run_trough_point_indexed, enumerate(combos), chunksize=chunksize
+    ):
+        raw_outputs[idx] = raw
+    return raw_outputs
+
+
+class TroughPool:
+    """
+    Multiprocessing pool whose workers each hold a set up trough model,
+    together with its number of worker processes.
+    Create it with create_trough_pool; like multiprocessing.Pool it can be
+    used as a context manager, which terminates the workers on exit.
+    """
+
+    def __init__(self, pool, processes):
+        self.pool = pool
+        self.processes = processes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.terminate()
+
+    def close(self):
+        self.pool.close()
+
+    def join(self):
+        self.pool.join()
+
+    def terminate(self):
+        self.pool.terminate()
+
+
+def create_trough_pool(
+    weather_file=weather_file_default,
+    config_file=config_file_default,
+    processes=6,
+):
+    """
+    Create a pool of worker processes where each worker holds a set up trough model.
+    The pool can be passed to generate_trough_data to run several sweeps
+    without restarting workers; the caller is responsible for closing it.
+
+    :param weather_file: Path to the weather data file
+    :param config_file: Path to the configuration data file
+    :param processes: Number of worker processes (default is 6; None uses os.cpu_count())
+    :return: TroughPool
+    """
+    with open(config_file, "r") as file:
+        config_data = json.load(file)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    pool = multiprocessing.Pool(
+        processes=processes,
+        initializer=_init_trough_worker,
+        initargs=(weather_file, config_data),
+    )
+
+    return TroughPool(pool, processes)
+
+
+def _get_chunksize(num_combos, processes):
+    """
+    Chunksize for running num_combos points on processes workers,
+    using the same heuristic as Pool.map for its default chunksize.
+    """
+    return max(1, num_combos // (processes * 4))
+
+
 def generate_trough_data(
     system_capacities=np.geomspace(1, 50, 3),
     hours_storages=[24],
@@ -175,6 +371,8 @@ def generate_trough_data(
     config_file=config_file_default,
     save_data=True,
     use_multiprocessing=True,
+    processes=6,
+    pool=None,
     dataset_filename=None,
 ):
     """
@@ -183,12 +381,17 @@ def generate_trough_data(
     This data could then be used to train a surrogate model.
 
     :param system_capacities: List of system capacities in MWt to be supplied by the trough system
-    :param hours_storages: List of number of hours of thermal storage (optional)
+    :param hours_storages: List of number of hours of thermal storage (optional);
+                           None uses the hours of storage in the configuration file
     :param temperatures_loop: List of loop outlet temperatures in Celsius (default is 300 C)
     :param weather_file: Path to the weather data file
     :param config_file: Path to the configuration data file
     :param save_data: If True, saves the results to a pickle file
     :param use_multiprocessing: If True, uses multiprocessing to run the model in parallel
+    :param processes: Number of worker processes to use with multiprocessing when no pool is provided
+    :param pool: Existing TroughPool from create_trough_pool to reuse (requires use_multiprocessing);
+                 its workers were set up with their own weather and configuration files,
+                 so weather_file, config_file, and processes are not used when a pool is provided
     :param dataset_filename: Path to the output dataset file (if save_data is True)
     :return: DataFrame containing the results from the model runs
     """
@@ -196,78 +399,66 @@ def generate_trough_data(
         # assume it is run for testing purposes
         dataset_filename = os.path.join(__location__, "data/test_data.pkl")
 
-    tech_model = setup_model_trough(weather_file=weather_file, config_file=config_file)
+    if pool is not None:
+        if not use_multiprocessing:
+            raise ValueError(
+                "A pool was provided but use_multiprocessing is False. "
+                "Set use_multiprocessing=True to run on the pool or do not pass a pool."
+            )
+        if not isinstance(pool, TroughPool):
+            raise TypeError(
+                f"pool must be a TroughPool created by create_trough_pool, not {type(pool).__name__}."
+            )
+
+    combos = list(product(system_capacities, hours_storages, temperatures_loop))
 
     if use_multiprocessing:
-        combos = list(product(system_capacities, hours_storages, temperatures_loop))
-        df = pd.DataFrame(
-            combos, columns=["system_capacity", "hours_storage", "temperature_loop"]
-        )
         time_start = time.process_time()
-        with multiprocessing.Pool(processes=6) as pool:
-            args_in = [(weather_file, config_file, *combo) for combo in combos]
-            results = pool.starmap(setup_and_run_trough, args_in)
+        if pool is None:
+            with create_trough_pool(
+                weather_file=weather_file,
+                config_file=config_file,
+                processes=processes,
+            ) as new_pool:
+                chunksize = _get_chunksize(len(combos), new_pool.processes)
+                raw_outputs = _run_trough_points(new_pool.pool, combos, chunksize)
+        else:
+            chunksize = _get_chunksize(len(combos), pool.processes)
+            raw_outputs = _run_trough_points(pool.pool, combos, chunksize)
         time_stop = time.process_time()
         # print("Multiprocessing time:", time_stop - time_start, "\n")
-        df_results = pd.DataFrame(results)
-        df = pd.concat(
-            [
-                df,
-                df_results[
-                    [
-                        "heat_annual",
-                        "electricity_annual",
-                        "freeze_protection",
-                        "capacity_factor",
-                        "solar_multiplier",
-                        "total_aperture_area",
-                        "number_loops",
-                    ]
-                ],
-            ],
-            axis=1,
-        )
     else:
-        data = []
-        combos = list(product(system_capacities, hours_storages, temperatures_loop))
+        tech_model = setup_model_trough(
+            weather_file=weather_file, config_file=config_file
+        )
+        tshours_default = tech_model.value("tshours")
+        raw_outputs = []
         for system_capacity, hours_storage, temperature_loop in combos:
-            results = run_model_trough(
-                tech_model,
-                system_capacity=system_capacity,
-                hours_storage=hours_storage,
-                temperature_loop=temperature_loop,
-            )
-            data.append(
-                [
-                    system_capacity,
-                    hours_storage,
-                    temperature_loop,
-                    results["heat_annual"],
-                    results["electricity_annual"],
-                    results["freeze_protection"],
-                    results["capacity_factor"],
-                    results["solar_multiplier"],
-                    results["total_aperture_area"],
-                    results["number_loops"],
-                ]
+            if hours_storage is None:
+                hours_storage = tshours_default
+            raw_outputs.append(
+                _execute_trough(
+                    tech_model,
+                    system_capacity=system_capacity,
+                    hours_storage=hours_storage,
+                    temperature_loop=temperature_loop,
+                )
             )
-        df = pd.DataFrame(
-            data,
-            columns=[
-                "system_capacity",
-                "hours_storage",
-                "temperature_loop",
-                "heat_annual",
-                "electricity_annual",
-                "freeze_protection",
-                "capacity_factor",
-                "solar_multiplier",
-                "total_aperture_area",
-                "number_loops",
-            ],
-        )
+
+    # post-process all runs at once and build the DataFrame in one pass
+    capacities, storages, temperatures = zip(*combos)
+    df = pd.DataFrame(
+        {
+            "system_capacity": capacities,
+            "hours_storage": storages,
+            "temperature_loop": temperatures,
+            **_postprocess_trough_outputs(raw_outputs),
+        },
+        dtype=np.float64,
+    )
+
     if save_data:
-        df.to_pickle(dataset_filename)
+        df.to_pickle(dataset_filename, protocol=5)
     return df
 
 
@@ -11,6 +11,8 @@
 #################################################################################
 
 import os
+import shutil
+import multiprocessing
 import pytest
 from pyomo.environ import (
     ConcreteModel,
@@ -43,8 +45,11 @@ from idaes.core.util.scaling import (
 from watertap_contrib.reflo.solar_models import (
     TroughSurrogate,
     generate_trough_data,
+    create_trough_pool,
+    TroughPool,
 )
 from watertap_contrib.reflo.costing import EnergyCosting
+from watertap_contrib.reflo.core import clear_surrogate_cache
 
 from watertap.core.solvers import get_solver
 
@@ -147,7 +152,7 @@ def build_trough2():
     return m
 
 
-def build_trough3():
+def build_trough3(surrogate_model_file=surrogate_model_file3):
     """
     Build trough surrogate with system_capacity, hours_storage, and temperature_loop as input variables.
     """
@@ -170,7 +175,7 @@ def build_trough3():
         "units": output_units,
     }
     trough_dict = dict(
-        surrogate_model_file=surrogate_model_file3,
+        surrogate_model_file=surrogate_model_file,
         dataset_filename=dataset_filename3,
         input_variables=input_variables,
         output_variables=output_variables,
@@ -756,6 +761,51 @@ class TestTroughSurrogate3:
                 assert pytest.approx(r, rel=1e-3) == value(cv)
 
 
+class TestTroughSurrogateCache:
+
+    @pytest.mark.unit
+    def test_shared_surrogate(self, tmp_path):
+        surrogate_file = str(tmp_path / "test_trough_surrogate3.json")
+        shutil.copy(surrogate_model_file3, surrogate_file)
+
+        m1 = build_trough3(surrogate_model_file=surrogate_file)
+        m2 = build_trough3(surrogate_model_file=surrogate_file)
+
+        assert isinstance(m1.fs.unit.surrogate, PysmoSurrogate)
+        assert m1.fs.unit.surrogate is m2.fs.unit.surrogate
+        assert m1.fs.unit.surrogate_blk is not m2.fs.unit.surrogate_blk
+
+    @pytest.mark.unit
+    def test_reload_modified_file(self, tmp_path):
+        surrogate_file = str(tmp_path / "test_trough_surrogate3.json")
+        shutil.copy(surrogate_model_file3, surrogate_file)
+
+        m1 = build_trough3(surrogate_model_file=surrogate_file)
+
+        # rewrite the file right away, as when retraining to the same path
+        with open(surrogate_model_file3, "r") as f:
+            surrogate_json = f.read()
+        with open(surrogate_file, "w") as f:
+            f.write(surrogate_json + "\n")
+
+        m2 = build_trough3(surrogate_model_file=surrogate_file)
+        m3 = build_trough3(surrogate_model_file=surrogate_file)
+
+        assert m2.fs.unit.surrogate is not m1.fs.unit.surrogate
+        assert m3.fs.unit.surrogate is m2.fs.unit.surrogate
+
+    @pytest.mark.unit
+    def test_clear_surrogate_cache(self, tmp_path):
+        surrogate_file = str(tmp_path / "test_trough_surrogate3.json")
+        shutil.copy(surrogate_model_file3, surrogate_file)
+
+        m1 = build_trough3(surrogate_model_file=surrogate_file)
+        clear_surrogate_cache()
+        m2 = build_trough3(surrogate_model_file=surrogate_file)
+
+        assert m2.fs.unit.surrogate is not m1.fs.unit.surrogate
+
+
 class TestCreateTroughSurrogate:
 
     @pytest.mark.component
@@ -766,6 +816,64 @@ class TestCreateTroughSurrogate:
         assert all(x > 0 for x in test_df.heat_annual.to_list())
         assert all(x > 0 for x in test_df.electricity_annual.to_list())
 
+    @pytest.mark.component
+    def test_run_pysam_trough_reuse_pool(self):
+
+        with create_trough_pool(processes=2) as pool:
+            assert pool.processes == 2
+            test_df1 = generate_trough_data(
+                system_capacities=[1, 50],
+                save_data=False,
+                pool=pool,
+            )
+            test_df2 = generate_trough_data(
+                system_capacities=[50, 1],
+                save_data=False,
+                pool=pool,
+            )
+
+        assert test_df1.system_capacity.to_list() == [1, 50]
+        assert test_df2.system_capacity.to_list() == [50, 1]
+        assert test_df1.heat_annual.to_list() == test_df2.heat_annual.to_list()[::-1]
+
+    @pytest.mark.component
+    def test_run_pysam_trough_default_storage(self):
+
+        # a single worker runs every point in order, so a point without
+        # hours_storage follows one that changed it on the same model
+        with create_trough_pool(processes=1) as pool:
+            test_df = generate_trough_data(
+                system_capacities=[10],
+                hours_storages=[12, None, 24],
+                save_data=False,
+                pool=pool,
+            )
+
+        # configured hours of storage are 24
+        heat_annual = test_df.heat_annual.to_list()
+        assert heat_annual[1] == heat_annual[2]
+        assert heat_annual[1] != heat_annual[0]
+
+    @pytest.mark.unit
+    def test_generate_trough_data_pool_errors(self):
+
+        with multiprocessing.Pool(processes=1) as pool:
+            with pytest.raises(
+                TypeError,
+                match="pool must be a TroughPool created by create_trough_pool, not Pool.",
+            ):
+                generate_trough_data(save_data=False, pool=pool)
+
+        with pytest.raises(
+            ValueError,
+            match="A pool was provided but use_multiprocessing is False.",
+        ):
+            generate_trough_data(
+                save_data=False,
+                use_multiprocessing=False,
+                pool=TroughPool(pool=None, processes=1),
+            )
+
     @pytest.mark.component
     def test_create_new_surrogate(self):
 
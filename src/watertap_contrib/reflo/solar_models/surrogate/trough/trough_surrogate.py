@@ -31,6 +31,8 @@ from watertap.core.solvers import get_solver
 from watertap_contrib.reflo.core import SolarEnergyBaseData
 from watertap_contrib.reflo.costing.solar.trough_surrogate import cost_trough_surrogate
 
+hours_per_year = value(pyunits.convert(1 * pyunits.year, to_units=pyunits.hour))
+
 __author__ = "Mukta Hardikar, Kurban Sitterley"
 
 
@@ -140,6 +142,15 @@ class TroughSurrogateData(SolarEnergyBaseData):
             )
         )
 
+        # Input frame for the surrogate evaluation in initialize_build
+        self.init_data = pd.DataFrame(
+            {
+                "system_capacity": [0.0],
+                "hours_storage": [0.0],
+                "temperature_loop": [0.0],
+            }
+        )
+
     def calculate_scaling_factors(self):
 
         if iscale.get_scaling_factor(self.system_capacity) is None:
@@ -204,20 +215,16 @@ class TroughSurrogateData(SolarEnergyBaseData):
         solve_log = idaeslog.getSolveLogger(self.name, outlvl, tag="unit")
 
         # Initialize surrogate
-        self.init_data = pd.DataFrame(
-            {
-                "system_capacity": [value(self.system_capacity)],
-                "hours_storage": [value(self.hours_storage)],
-                "temperature_loop": [value(self.temperature_loop)],
-            }
-        )
+        self.init_data.at[0, "system_capacity"] = value(self.system_capacity)
+        self.init_data.at[0, "hours_storage"] = value(self.hours_storage)
+        self.init_data.at[0, "temperature_loop"] = value(self.temperature_loop)
         self.init_output = self.surrogate.evaluate_surrogate(self.init_data)
-        self.heat_annual_scaled.set_value(self.init_output.heat_annual_scaled.values[0])
+        self.heat_annual_scaled.set_value(self.init_output.heat_annual_scaled.iat[0])
         self.electricity_annual_scaled.set_value(
-            self.init_output.electricity_annual_scaled.values[0]
+            self.init_output.electricity_annual_scaled.iat[0]
         )
-        self.heat.set_value(value(self.heat_annual) / 8766)
-        self.electricity.set_value(value(self.electricity_annual) / 8766)
+        self.heat.set_value(value(self.heat_annual) / hours_per_year)
+        self.electricity.set_value(value(self.electricity_annual) / hours_per_year)
 
         # Solve unit
         opt = get_solver(solver, optarg)
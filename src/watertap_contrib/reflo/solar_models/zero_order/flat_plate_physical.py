@@ -452,44 +452,34 @@ class FlatPlatePhysicalData(SolarEnergyBaseData):
         super().calculate_scaling_factors()
 
         if iscale.get_scaling_factor(self.collector_area) is None:
-            sf = iscale.get_scaling_factor(self.collector_area, default=1)
-            iscale.set_scaling_factor(self.collector_area, sf)
+            iscale.set_scaling_factor(self.collector_area, 1)
 
         if iscale.get_scaling_factor(self.collector_area_total) is None:
-            sf = iscale.get_scaling_factor(self.collector_area_total, default=1)
-            iscale.set_scaling_factor(self.collector_area_total, sf)
+            iscale.set_scaling_factor(self.collector_area_total, 1)
 
         if iscale.get_scaling_factor(self.total_irradiance) is None:
-            sf = iscale.get_scaling_factor(self.total_irradiance, default=1e-2)
-            iscale.set_scaling_factor(self.total_irradiance, sf)
+            iscale.set_scaling_factor(self.total_irradiance, 1e-2)
 
         if iscale.get_scaling_factor(self.Fprime_UL) is None:
-            sf = iscale.get_scaling_factor(self.Fprime_UL, default=1)
-            iscale.set_scaling_factor(self.Fprime_UL, sf)
+            iscale.set_scaling_factor(self.Fprime_UL, 1)
 
         if iscale.get_scaling_factor(self.ratio_FRta) is None:
-            sf = iscale.get_scaling_factor(self.ratio_FRta, default=1)
-            iscale.set_scaling_factor(self.ratio_FRta, sf)
+            iscale.set_scaling_factor(self.ratio_FRta, 1)
 
         if iscale.get_scaling_factor(self.net_heat_gain) is None:
-            sf = iscale.get_scaling_factor(self.net_heat_gain, default=1e-3)
-            iscale.set_scaling_factor(self.net_heat_gain, sf)
+            iscale.set_scaling_factor(self.net_heat_gain, 1e-3)
 
         if iscale.get_scaling_factor(self.system_capacity) is None:
-            sf = iscale.get_scaling_factor(self.system_capacity, default=1e-3)
-            iscale.set_scaling_factor(self.system_capacity, sf)
+            iscale.set_scaling_factor(self.system_capacity, 1e-3)
 
         if iscale.get_scaling_factor(self.heat_annual) is None:
-            sf = iscale.get_scaling_factor(self.heat_annual, default=1e-6)
-            iscale.set_scaling_factor(self.heat_annual, sf)
+            iscale.set_scaling_factor(self.heat_annual, 1e-6)
 
         if iscale.get_scaling_factor(self.heat) is None:
-            sf = iscale.get_scaling_factor(self.heat, default=1e-3)
-            iscale.set_scaling_factor(self.heat, sf)
+            iscale.set_scaling_factor(self.heat, 1e-3)
 
         if iscale.get_scaling_factor(self.electricity) is None:
-            sf = iscale.get_scaling_factor(self.electricity, default=0.1)
-            iscale.set_scaling_factor(self.electricity, sf)
+            iscale.set_scaling_factor(self.electricity, 0.1)
 
     @property
     def default_costing_method(self):
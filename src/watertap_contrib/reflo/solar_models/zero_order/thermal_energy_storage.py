@@ -375,40 +375,31 @@ class ThermalEnergyStorageData(UnitModelBlockData):
         super().calculate_scaling_factors()
 
         if iscale.get_scaling_factor(self.tes_volume) is None:
-            sf = iscale.get_scaling_factor(self.tes_volume, default=1e-1)
-            iscale.set_scaling_factor(self.tes_volume, sf)
+            iscale.set_scaling_factor(self.tes_volume, 1e-1)
 
         if iscale.get_scaling_factor(self.heat_in) is None:
-            sf = iscale.get_scaling_factor(self.heat_in, default=1e-3)
-            iscale.set_scaling_factor(self.heat_in, sf)
+            iscale.set_scaling_factor(self.heat_in, 1e-3)
 
         if iscale.get_scaling_factor(self.heat_out) is None:
-            sf = iscale.get_scaling_factor(self.heat_out, default=1e-3)
-            iscale.set_scaling_factor(self.heat_out, sf)
+            iscale.set_scaling_factor(self.heat_out, 1e-3)
 
         if iscale.get_scaling_factor(self.tes_initial_temperature) is None:
-            sf = iscale.get_scaling_factor(self.tes_initial_temperature, default=1e-2)
-            iscale.set_scaling_factor(self.tes_initial_temperature, sf)
+            iscale.set_scaling_factor(self.tes_initial_temperature, 1e-2)
 
         if iscale.get_scaling_factor(self.tes_temperature) is None:
-            sf = iscale.get_scaling_factor(self.tes_temperature, default=1e-2)
-            iscale.set_scaling_factor(self.tes_temperature, sf)
+            iscale.set_scaling_factor(self.tes_temperature, 1e-2)
 
         if iscale.get_scaling_factor(self.dt) is None:
-            sf = iscale.get_scaling_factor(self.dt, default=1e-3)
-            iscale.set_scaling_factor(self.dt, sf)
+            iscale.set_scaling_factor(self.dt, 1e-3)
 
         if iscale.get_scaling_factor(self.electricity) is None:
-            sf = iscale.get_scaling_factor(self.electricity, default=1e-1)
-            iscale.set_scaling_factor(self.electricity, sf)
+            iscale.set_scaling_factor(self.electricity, 1e-1)
 
         if iscale.get_scaling_factor(self.heat_load) is None:
-            sf = iscale.get_scaling_factor(self.heat_load, default=1e-3)
-            iscale.set_scaling_factor(self.heat_load, sf)
+            iscale.set_scaling_factor(self.heat_load, 1e-3)
 
         if iscale.get_scaling_factor(self.thermal_energy_capacity) is None:
-            sf = iscale.get_scaling_factor(self.thermal_energy_capacity, default=1e-5)
-            iscale.set_scaling_factor(self.thermal_energy_capacity, sf)
+            iscale.set_scaling_factor(self.thermal_energy_capacity, 1e-5)
 
     @property
     def default_costing_method(self):